@@ -6,13 +6,167 @@ Handles data loading, cleaning, and preparation.
 
 import pandas as pd
 import numpy as np
-import yfinance as yf
-from typing import Optional, Tuple
-from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime, timedelta
+from pathlib import Path
+import hashlib
+import os
+import time
 import warnings
 warnings.filterwarnings('ignore')
 
 
+# On-disk cache for downloaded price data (override with ALPHA_DECAY_CACHE_DIR)
+CACHE_DIR = Path(os.environ.get('ALPHA_DECAY_CACHE_DIR', Path(__file__).resolve().parent / '.price_cache'))
+
+# Requests ending within CACHE_RECENT_DAYS of today are refetched once their cache file is older than this
+CACHE_RECENT_DAYS = 7
+CACHE_TTL_SECONDS = 24 * 60 * 60
+
+
+def to_naive_index(series: pd.Series) -> pd.Series:
+    """
+    Return series with a timezone-naive index.
+    
+    Timezone-aware indices are converted to UTC and then stripped, so that
+    comparisons with naive dates work. Naive series are returned unchanged.
+    """
+    if getattr(series.index, 'tz', None) is None:
+        return series
+    return series.set_axis(series.index.tz_convert('UTC').tz_localize(None))
+
+
+def _prepare_price_data(data: pd.DataFrame, freq: str) -> Tuple[pd.Series, Optional[pd.Series]]:
+    """Extract timezone-naive (prices, volumes) from an OHLCV frame and resample."""
+    # Remove timezone info to avoid comparison issues
+    prices = to_naive_index(data['Close'])
+    volumes = to_naive_index(data['Volume'])
+    
+    # Resample if needed
+    if freq == 'M':
+        prices = prices.resample('M').last()
+        volumes = volumes.resample('M').last()
+    
+    return prices, volumes
+
+
+def _cache_path(ticker: str, start_date: datetime, end_date: datetime, freq: str) -> Path:
+    """Parquet cache file for one (ticker, start, end, freq) request."""
+    key = f"{ticker}|{pd.Timestamp(start_date).date()}|{pd.Timestamp(end_date).date()}|{freq}"
+    return CACHE_DIR / f"{hashlib.sha1(key.encode()).hexdigest()}.parquet"
+
+
+def _read_price_cache(path: Path, end_date: datetime) -> Optional[Tuple[pd.Series, pd.Series]]:
+    """Read cached (prices, volumes), or None if missing, stale or unreadable."""
+    if not path.exists():
+        return None
+    
+    # Windows ending recently can still gain bars, so only trust fresh files for them
+    is_recent = pd.Timestamp(end_date).date() >= (datetime.now() - timedelta(days=CACHE_RECENT_DAYS)).date()
+    if is_recent and time.time() - path.stat().st_mtime > CACHE_TTL_SECONDS:
+        return None
+    
+    try:
+        data = pd.read_parquet(path)
+    except Exception:
+        return None
+    return data['Close'], data['Volume']
+
+
+def _write_price_cache(path: Path, prices: pd.Series, volumes: pd.Series):
+    """Write (prices, volumes) to the cache; silently skipped without a parquet engine."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        pd.DataFrame({'Close': prices, 'Volume': volumes}).to_parquet(path, compression='zstd')
+    except Exception:
+        pass
+
+
+def _download_price_data(tickers: List[str], start_date: datetime, end_date: datetime,
+                         freq: str) -> Dict[str, Tuple[pd.Series, Optional[pd.Series]]]:
+    """
+    Download price and volume data for several tickers in one batched request.
+    
+    yfinance fetches the symbols concurrently on a thread pool, so latency is
+    bounded by the slowest ticker instead of the sum over all tickers.
+    """
+    # Imported here so the non-network helpers don't pay yfinance's import cost
+    import yfinance as yf
+    
+    empty = (pd.Series(dtype=float), None)
+    
+    try:
+        data = yf.download(
+            ' '.join(tickers), start=start_date, end=end_date,
+            threads=True, auto_adjust=True, progress=False, group_by='ticker'
+        )
+    except Exception as e:
+        print(f"Error loading data for {', '.join(tickers)}: {e}")
+        return {ticker: empty for ticker in tickers}
+    
+    results = {}
+    for ticker in tickers:
+        # group_by='ticker' yields (ticker, field) columns; a lone ticker may come back flat
+        if isinstance(data.columns, pd.MultiIndex):
+            if ticker not in data.columns.get_level_values(0):
+                print(f"Warning: No data for {ticker}")
+                results[ticker] = empty
+                continue
+            ticker_data = data[ticker]
+        else:
+            ticker_data = data
+        
+        # The batch is aligned on the union of dates; drop rows this ticker lacks
+        ticker_data = ticker_data.dropna(how='all')
+        if len(ticker_data) == 0:
+            print(f"Warning: No data for {ticker}")
+            results[ticker] = empty
+            continue
+        
+        results[ticker] = _prepare_price_data(ticker_data, freq)
+    
+    return results
+
+
+def load_price_data_many(tickers: List[str], start_date: datetime, end_date: datetime,
+                         freq: str = 'D', use_cache: bool = True
+                         ) -> Dict[str, Tuple[pd.Series, Optional[pd.Series]]]:
+    """
+    Load price and volume data for several tickers.
+    
+    Results are cached as Parquet files under CACHE_DIR, keyed by
+    (ticker, start, end, freq); only tickers missing from the cache are
+    downloaded, in a single batched request.
+    
+    Args:
+        tickers: Stock ticker symbols
+        start_date: Start date
+        end_date: End date
+        freq: Frequency ('D' for daily, 'M' for monthly)
+        use_cache: Read from / write to the on-disk cache (default True)
+    
+    Returns:
+        Dict mapping ticker to (prices, volumes), as returned by load_price_data
+    """
+    results = {}
+    missing = []
+    for ticker in tickers:
+        cached = _read_price_cache(_cache_path(ticker, start_date, end_date, freq), end_date) if use_cache else None
+        if cached is None:
+            missing.append(ticker)
+        else:
+            results[ticker] = cached
+    
+    if missing:
+        downloaded = _download_price_data(missing, start_date, end_date, freq)
+        for ticker, (prices, volumes) in downloaded.items():
+            if use_cache and len(prices) > 0:
+                _write_price_cache(_cache_path(ticker, start_date, end_date, freq), prices, volumes)
+        results.update(downloaded)
+    
+    return {ticker: results[ticker] for ticker in tickers}
+
+
 def load_price_data(ticker: str, start_date: datetime, end_date: datetime,
                    freq: str = 'D') -> Tuple[pd.Series, Optional[pd.Series]]:
     """
@@ -27,34 +181,7 @@ def load_price_data(ticker: str, start_date: datetime, end_date: datetime,
     Returns:
         Tuple of (prices, volumes) - both with timezone-naive index
     """
-    try:
-        stock = yf.Ticker(ticker)
-        data = stock.history(start=start_date, end=end_date)
-        
-        if len(data) == 0:
-            print(f"Warning: No data for {ticker}")
-            return pd.Series(dtype=float), None
-        
-        prices = data['Close']
-        volumes = data['Volume']
-        
-        # Remove timezone info to avoid comparison issues
-        # Convert timezone-aware to naive by converting to UTC first, then removing timezone
-        if prices.index.tz is not None:
-            prices.index = prices.index.tz_convert('UTC').tz_localize(None)
-        if volumes is not None and volumes.index.tz is not None:
-            volumes.index = volumes.index.tz_convert('UTC').tz_localize(None)
-        
-        # Resample if needed
-        if freq == 'M':
-            prices = prices.resample('M').last()
-            volumes = volumes.resample('M').last()
-        
-        return prices, volumes
-    
-    except Exception as e:
-        print(f"Error loading data for {ticker}: {e}")
-        return pd.Series(dtype=float), None
+    return load_price_data_many([ticker], start_date, end_date, freq)[ticker]
 
 
 def compute_forward_returns(prices: pd.Series, horizon: int = 1) -> pd.Series:
@@ -72,10 +199,7 @@ def compute_forward_returns(prices: pd.Series, horizon: int = 1) -> pd.Series:
     forward_returns = (forward_prices / prices) - 1
     
     # Ensure index is timezone-naive (in case prices had timezone)
-    if forward_returns.index.tz is not None:
-        forward_returns.index = forward_returns.index.tz_convert('UTC').tz_localize(None)
-    
-    return forward_returns
+    return to_naive_index(forward_returns)
 
 
 def align_signals_and_returns(signals: pd.Series, forward_returns: pd.Series) -> Tuple[pd.Series, pd.Series]:
@@ -90,21 +214,12 @@ def align_signals_and_returns(signals: pd.Series, forward_returns: pd.Series) ->
         Tuple of (aligned_signals, aligned_returns) - both with timezone-naive indices
     """
     # Ensure both indices are timezone-naive
-    if signals.index.tz is not None:
-        signals = signals.copy()
-        signals.index = signals.index.tz_convert('UTC').tz_localize(None)
-    if forward_returns.index.tz is not None:
-        forward_returns = forward_returns.copy()
-        forward_returns.index = forward_returns.index.tz_convert('UTC').tz_localize(None)
+    signals = to_naive_index(signals)
+    forward_returns = to_naive_index(forward_returns)
     
-    # Find common index
-    common_idx = signals.index.intersection(forward_returns.index)
-    
-    aligned_signals = signals.loc[common_idx]
-    aligned_returns = forward_returns.loc[common_idx]
-    
-    # Drop any remaining NaNs
-    valid_mask = aligned_signals.notna() & aligned_returns.notna()
+    # Inner-join the indices in one pass, then drop any remaining NaNs
+    aligned_signals, aligned_returns = signals.align(forward_returns, join='inner')
+    valid_mask = aligned_signals.notna().to_numpy() & aligned_returns.notna().to_numpy()
     
     return aligned_signals[valid_mask], aligned_returns[valid_mask]
 
@@ -141,19 +256,18 @@ def create_portfolio_returns(prices_dict: dict, weights: Optional[dict] = None)
     Returns:
         Portfolio returns series
     """
-    returns_dict = {}
-    for ticker, prices in prices_dict.items():
-        returns_dict[ticker] = prices.pct_change()
-    
-    returns_df = pd.DataFrame(returns_dict)
+    # Align once, then compute every ticker's return in one block op. Dividing by
+    # the forward-filled previous price keeps each ticker's return across dates
+    # that only other tickers trade on, as a per-ticker pct_change would.
+    prices_df = pd.concat(prices_dict, axis=1)
+    returns_df = prices_df / prices_df.ffill().shift(1) - 1
     
     if weights is None:
         # Equal-weighted
         portfolio_returns = returns_df.mean(axis=1)
     else:
-        # Weighted
-        weights_series = pd.Series(weights)
-        portfolio_returns = (returns_df * weights_series).sum(axis=1)
+        # Weighted (missing returns and unweighted tickers contribute zero)
+        w = np.array([weights.get(ticker, 0.0) for ticker in returns_df.columns])
+        portfolio_returns = pd.Series(returns_df.fillna(0.0).to_numpy() @ w, index=returns_df.index)
     
     return portfolio_returns
-
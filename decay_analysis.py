@@ -9,14 +9,22 @@ import pandas as pd
 import numpy as np
 from typing import Dict, Tuple, Optional
 from datetime import datetime
-from scipy import stats
 import warnings
 warnings.filterwarnings('ignore')
 
+from data_utils import to_naive_index
+from kernels import NUMBA_AVAILABLE, mann_whitney_u, performance_stats
+
 
 class PerformanceMetrics:
     """Container for performance metrics."""
     
+    # Fixed field set: no per-instance __dict__, one compact record per signal/proxy/regime
+    __slots__ = (
+        'sharpe_ratio', 'hit_rate', 'max_drawdown', 'return_mean', 'return_std',
+        'total_return', 'num_observations', 'start_date', 'end_date',
+    )
+    
     def __init__(self):
         self.sharpe_ratio: Optional[float] = None
         self.hit_rate: Optional[float] = None
@@ -30,17 +38,7 @@ class PerformanceMetrics:
     
     def to_dict(self) -> Dict:
         """Convert to dictionary for easy export."""
-        return {
-            'sharpe_ratio': self.sharpe_ratio,
-            'hit_rate': self.hit_rate,
-            'max_drawdown': self.max_drawdown,
-            'return_mean': self.return_mean,
-            'return_std': self.return_std,
-            'total_return': self.total_return,
-            'num_observations': self.num_observations,
-            'start_date': self.start_date,
-            'end_date': self.end_date,
-        }
+        return {field: getattr(self, field) for field in self.__slots__}
     
     def __repr__(self):
         sharpe_str = f"{self.sharpe_ratio:.3f}" if self.sharpe_ratio else 'N/A'
@@ -70,12 +68,8 @@ def compute_returns(signals: pd.Series, forward_returns: pd.Series,
         pd.Series: Strategy returns (with timezone-naive index)
     """
     # Ensure both inputs have timezone-naive indices
-    if signals.index.tz is not None:
-        signals = signals.copy()
-        signals.index = signals.index.tz_convert('UTC').tz_localize(None)
-    if forward_returns.index.tz is not None:
-        forward_returns = forward_returns.copy()
-        forward_returns.index = forward_returns.index.tz_convert('UTC').tz_localize(None)
+    signals = to_naive_index(signals)
+    forward_returns = to_naive_index(forward_returns)
     
     # Align indices
     aligned_data = pd.DataFrame({
@@ -86,21 +80,26 @@ def compute_returns(signals: pd.Series, forward_returns: pd.Series,
     if len(aligned_data) == 0:
         return pd.Series(dtype=float)
     
-    # Long top quantile, short bottom quantile
-    signal_quantile = aligned_data['signal'].quantile(quantile)
-    
-    # Simple binary signal: 1 if above median, -1 if below
-    long_short = np.where(aligned_data['signal'] > signal_quantile, 1, -1)
+    signal = aligned_data['signal'].to_numpy()
+    forward_return = aligned_data['forward_return'].to_numpy()
     
-    # Strategy returns
-    strategy_returns = long_short * aligned_data['forward_return']
+    # Long top quantile, short bottom quantile
+    signal_quantile = np.quantile(signal, quantile)
     
-    # Ensure the returned index is timezone-naive
-    result_index = aligned_data.index
-    if result_index.tz is not None:
-        result_index = result_index.tz_convert('UTC').tz_localize(None)
+    # Strategy returns: +forward return if above the quantile, -forward return if below.
+    # The index is already timezone-naive since both inputs were normalized above.
+    strategy_returns = np.where(signal > signal_quantile, forward_return, -forward_return)
     
-    return pd.Series(strategy_returns, index=result_index)
+    return pd.Series(strategy_returns, index=aligned_data.index)
+
+
+def _performance_stats_numpy(values: np.ndarray) -> Tuple[float, float, float, float, float]:
+    """Vectorized equivalent of kernels.performance_stats."""
+    cumulative = np.cumprod(1.0 + values)
+    running_max = np.maximum.accumulate(cumulative)
+    max_drawdown = ((cumulative - running_max) / running_max).min()
+    std = values.std(ddof=1) if len(values) > 1 else np.nan
+    return values.mean(), std, (values > 0).mean(), cumulative[-1] - 1, max_drawdown
 
 
 def compute_performance_metrics(returns: pd.Series) -> PerformanceMetrics:
@@ -127,10 +126,15 @@ def compute_performance_metrics(returns: pd.Series) -> PerformanceMetrics:
     metrics.start_date = returns_clean.index[0]
     metrics.end_date = returns_clean.index[-1]
     
-    # Basic statistics
-    metrics.return_mean = returns_clean.mean()
-    metrics.return_std = returns_clean.std()
-    metrics.total_return = (1 + returns_clean).prod() - 1
+    # Basic statistics, hit rate and drawdown (one compiled pass when numba is available)
+    values = returns_clean.to_numpy(dtype=float)
+    if NUMBA_AVAILABLE:
+        mean, std, hit_rate, total_return, max_drawdown = performance_stats(values)
+    else:
+        mean, std, hit_rate, total_return, max_drawdown = _performance_stats_numpy(values)
+    metrics.return_mean = mean
+    metrics.return_std = std
+    metrics.total_return = total_return
     
     # Sharpe ratio (annualized if daily data)
     if metrics.return_std > 0:
@@ -144,13 +148,10 @@ def compute_performance_metrics(returns: pd.Series) -> PerformanceMetrics:
         metrics.sharpe_ratio = sharpe
     
     # Hit rate (percentage of positive returns)
-    metrics.hit_rate = (returns_clean > 0).mean()
+    metrics.hit_rate = hit_rate
     
-    # Maximum drawdown
-    cumulative = (1 + returns_clean).cumprod()
-    running_max = cumulative.expanding().max()
-    drawdown = (cumulative - running_max) / running_max
-    metrics.max_drawdown = drawdown.min()
+    # Maximum drawdown (relative to running peak of cumulative wealth)
+    metrics.max_drawdown = max_drawdown
     
     return metrics
 
@@ -177,8 +178,11 @@ def split_pre_post(returns: pd.Series, discovery_date: datetime) -> Tuple[pd.Ser
     discovery_date = pd.Timestamp(discovery_date)
     if discovery_date.tz is not None:
         discovery_date = discovery_date.tz_convert('UTC').tz_localize(None)
-    else:
-        discovery_date = pd.Timestamp(discovery_date, tz=None)
+    
+    # Sorted index: binary search for the split point and slice without copying
+    if returns.index.is_monotonic_increasing:
+        split = returns.index.searchsorted(discovery_date, side='left')
+        return returns.iloc[:split], returns.iloc[split:]
     
     pre_returns = returns[returns.index < discovery_date]
     post_returns = returns[returns.index >= discovery_date]
@@ -230,6 +234,33 @@ def compute_decay_stats(pre_metrics: PerformanceMetrics,
     return decay_stats
 
 
+def _mannwhitneyu_less(x: np.ndarray, y: np.ndarray) -> Tuple[float, float]:
+    """
+    One-sided Mann-Whitney U test (H1: x < y) using the compiled rank kernel.
+    
+    Matches scipy.stats.mannwhitneyu(x, y, alternative='less') with the normal
+    approximation, tie correction and continuity correction.
+    
+    Returns:
+        Tuple of (U statistic for x, p-value)
+    """
+    from scipy import special
+    
+    n1, n2 = len(x), len(y)
+    n = n1 + n2
+    u1, tie_term = mann_whitney_u(x, y)
+    
+    # Normal approximation on U for y (large U2 <=> x tends to be smaller)
+    u2 = n1 * n2 - u1
+    mu = n1 * n2 / 2
+    sigma = np.sqrt(n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1))))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        z = (u2 - mu - 0.5) / sigma
+    pvalue = float(np.clip(special.ndtr(-z), 0, 1))
+    
+    return u1, pvalue
+
+
 def test_decay_significance(pre_returns: pd.Series, post_returns: pd.Series) -> Dict:
     """
     Test statistical significance of decay.
@@ -252,10 +283,15 @@ def test_decay_significance(pre_returns: pd.Series, post_returns: pd.Series) ->
         }
     
     # Mann-Whitney U test (one-sided: H0: post >= pre, H1: post < pre)
-    statistic, pvalue = stats.mannwhitneyu(
-        post_clean, pre_clean, 
-        alternative='less'  # Testing if post is less than pre
-    )
+    if NUMBA_AVAILABLE:
+        statistic, pvalue = _mannwhitneyu_less(post_clean.to_numpy(dtype=float),
+                                               pre_clean.to_numpy(dtype=float))
+    else:
+        from scipy import stats
+        statistic, pvalue = stats.mannwhitneyu(
+            post_clean, pre_clean, 
+            alternative='less'  # Testing if post is less than pre
+        )
     
     return {
         'statistic': statistic,
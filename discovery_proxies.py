@@ -7,6 +7,7 @@ only reasonable proxies.
 """
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Optional
 import pandas as pd
 
@@ -58,6 +59,17 @@ DISCOVERY_DATES = {
 }
 
 
+# Earliest / latest date per signal across all proxies (DISCOVERY_DATES is constant)
+_DISCOVERY_MIN = {
+    signal: min(d for d in dates.values() if d is not None)
+    for signal, dates in DISCOVERY_DATES.items() if dates
+}
+_DISCOVERY_MAX = {
+    signal: max(d for d in dates.values() if d is not None)
+    for signal, dates in DISCOVERY_DATES.items() if dates
+}
+
+
 class AcademicPaperProxy(DiscoveryProxy):
     """
     Proxy: First major academic paper publication.
@@ -123,11 +135,8 @@ class ConservativeProxy(DiscoveryProxy):
         )
     
     def get_discovery_date(self, signal_name: str) -> Optional[datetime]:
-        dates = DISCOVERY_DATES.get(signal_name, {})
-        if not dates:
-            return None
         # Return earliest date
-        return min(d for d in dates.values() if d is not None)
+        return _DISCOVERY_MIN.get(signal_name)
 
 
 class AggressiveProxy(DiscoveryProxy):
@@ -144,33 +153,32 @@ class AggressiveProxy(DiscoveryProxy):
         )
     
     def get_discovery_date(self, signal_name: str) -> Optional[datetime]:
-        dates = DISCOVERY_DATES.get(signal_name, {})
-        if not dates:
-            return None
         # Return latest date
-        return max(d for d in dates.values() if d is not None)
+        return _DISCOVERY_MAX.get(signal_name)
 
 
-# Proxy registry
-PROXY_REGISTRY = {
-    'academic': AcademicPaperProxy(),
-    'book': PopularBookProxy(),
-    'blog': BlogMentionsProxy(),
-    'conservative': ConservativeProxy(),
-    'aggressive': AggressiveProxy(),
+# Proxy registry (classes; instances are built on first use by get_proxy)
+_PROXY_CLASSES = {
+    'academic': AcademicPaperProxy,
+    'book': PopularBookProxy,
+    'blog': BlogMentionsProxy,
+    'conservative': ConservativeProxy,
+    'aggressive': AggressiveProxy,
 }
 
 
+@lru_cache(maxsize=None)
 def get_proxy(name: str) -> DiscoveryProxy:
     """Get discovery proxy by name."""
-    if name not in PROXY_REGISTRY:
-        raise ValueError(f"Unknown proxy: {name}. Available: {list(PROXY_REGISTRY.keys())}")
-    return PROXY_REGISTRY[name]
+    proxy_cls = _PROXY_CLASSES.get(name)
+    if proxy_cls is None:
+        raise ValueError(f"Unknown proxy: {name}. Available: {list(_PROXY_CLASSES.keys())}")
+    return proxy_cls()
 
 
 def list_proxies() -> Dict[str, str]:
     """List all available proxies with descriptions."""
-    return {name: proxy.description for name, proxy in PROXY_REGISTRY.items()}
+    return {name: proxy_cls().description for name, proxy_cls in _PROXY_CLASSES.items()}
 
 
 def get_discovery_date(signal_name: str, proxy_name: str = 'conservative') -> Optional[datetime]:
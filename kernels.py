@@ -0,0 +1,460 @@
+"""
+Kernels Module
+
+Compiled inner loops for the rolling and single-pass statistics used by the
+analysis modules. Numba is optional: without it the kernels run as plain
+Python with identical results, just slower.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def rolling_sharpe(arr, window, periods_per_year, out_sharpe, out_mean):
+    """
+    Rolling Sharpe ratio and mean over a trailing window, written in place.
+
+    Keeps running sums of x and x^2 (NaNs skipped) so each step is O(1).
+    The std uses ddof=1 to match pandas; windows with zero or undefined std
+    get a Sharpe of 0.
+
+    Args:
+        arr: Return array
+        window: Window length
+        periods_per_year: Annualization factor
+        out_sharpe: Output array of length len(arr) - window + 1;
+            entry j covers arr[j:j + window]
+        out_mean: Output array for the rolling mean, same layout
+    """
+    ann = np.sqrt(periods_per_year)
+
+    s = 0.0
+    s2 = 0.0
+    n = 0
+    for i in range(len(arr)):
+        x = arr[i]
+        if not np.isnan(x):
+            s += x
+            s2 += x * x
+            n += 1
+        if i >= window:
+            x_old = arr[i - window]
+            if not np.isnan(x_old):
+                s -= x_old
+                s2 -= x_old * x_old
+                n -= 1
+        if i < window - 1:
+            continue
+
+        j = i - window + 1
+        mean = s / n if n > 0 else np.nan
+        sharpe = 0.0
+        if n > 1:
+            var = (s2 - s * mean) / (n - 1)
+            if var > 0:
+                sharpe = mean / np.sqrt(var) * ann
+        out_sharpe[j] = sharpe
+        out_mean[j] = mean
+
+
+@njit(cache=True)
+def rolling_controls(r, window):
+    """
+    Fused rolling volatility, turnover and cost proxies for MarketControls.
+
+    One pass over the returns maintains running sums of r, r^2 and |r|.
+
+    Args:
+        r: Return array (no NaNs)
+        window: Window length
+
+    Returns:
+        Tuple of (volatility, turnover, transaction_costs) arrays aligned
+        with ``r`` and of the same dtype (sums are accumulated in float64);
+        volatility is the annualized ddof=1 std, turnover the rolling mean
+        of |r|, and costs their product. The first ``window - 1`` entries
+        are NaN.
+    """
+    n_obs = len(r)
+    out_vol = np.empty_like(r)
+    out_turn = np.empty_like(r)
+    out_tc = np.empty_like(r)
+    out_vol[:window - 1] = np.nan
+    out_turn[:window - 1] = np.nan
+    out_tc[:window - 1] = np.nan
+    ann = np.sqrt(252.0)
+
+    s = 0.0
+    s2 = 0.0
+    abs_s = 0.0
+    for i in range(n_obs):
+        x = np.float64(r[i])
+        s += x
+        s2 += x * x
+        abs_s += abs(x)
+        if i >= window:
+            x_old = np.float64(r[i - window])
+            s -= x_old
+            s2 -= x_old * x_old
+            abs_s -= abs(x_old)
+        if i < window - 1:
+            continue
+
+        var = (s2 - s * s / window) / (window - 1)
+        vol = np.sqrt(var) * ann if var > 0 else 0.0
+        turn = abs_s / window
+        out_vol[i] = vol
+        out_turn[i] = turn
+        out_tc[i] = turn * vol
+
+    return out_vol, out_turn, out_tc
+
+
+@njit(cache=True)
+def performance_stats(r):
+    """
+    Single-pass summary statistics of a return series.
+
+    Args:
+        r: Non-empty return array (no NaNs)
+
+    Returns:
+        Tuple of (mean, std, hit_rate, total_return, max_drawdown); std uses
+        ddof=1 (NaN for a single observation) and the drawdown is measured
+        against the running peak of cumulative wealth, starting from the
+        first observation.
+    """
+    n = len(r)
+    s = 0.0
+    s2 = 0.0
+    hits = 0
+    cum = 1.0
+    peak = -np.inf
+    max_dd = 0.0
+    for i in range(n):
+        x = r[i]
+        s += x
+        s2 += x * x
+        if x > 0:
+            hits += 1
+        cum *= 1.0 + x
+        if cum > peak:
+            peak = cum
+        dd = (cum - peak) / peak
+        if dd < max_dd:
+            max_dd = dd
+
+    mean = s / n
+    std = np.nan
+    if n > 1:
+        var = (s2 - s * mean) / (n - 1)
+        std = np.sqrt(var) if var > 0 else 0.0
+    return mean, std, hits / n, cum - 1.0, max_dd
+
+
+@njit(cache=True)
+def mann_whitney_u(x, y):
+    """
+    Mann-Whitney U statistic of x against y, with tie-averaged ranks.
+
+    Args:
+        x: First sample (no NaNs)
+        y: Second sample (no NaNs)
+
+    Returns:
+        Tuple of (U for x, tie term sum(t^3 - t) over groups of tied values)
+    """
+    n1 = len(x)
+    n = n1 + len(y)
+    combined = np.concatenate((x, y))
+    order = np.argsort(combined)
+
+    rank_sum_x = 0.0
+    tie_term = 0.0
+    i = 0
+    while i < n:
+        # Run of equal values occupies sorted positions i..j; all get the average rank
+        j = i
+        while j + 1 < n and combined[order[j + 1]] == combined[order[i]]:
+            j += 1
+        avg_rank = 0.5 * (i + j) + 1.0
+        for k in range(i, j + 1):
+            if order[k] < n1:
+                rank_sum_x += avg_rank
+        t = j - i + 1
+        tie_term += t * t * t - t
+        i = j + 1
+
+    return rank_sum_x - n1 * (n1 + 1) / 2.0, tie_term
+
+
+# ---------------------------------------------------------------------------
+# Rolling price statistics for the signal definitions.
+#
+# These follow pandas' rolling(window) semantics: the output is NaN until the
+# window is full and whenever the window holds a NaN, the std uses ddof=1,
+# and a window of identical values gives exactly that value / a std of 0.
+# ---------------------------------------------------------------------------
+
+@njit(cache=True)
+def _sum_step(x, i, window, s, n_nan):
+    """Slide a running sum (NaNs counted, not summed) to end at x[i]."""
+    v = np.float64(x[i])
+    if np.isnan(v):
+        n_nan += 1
+    else:
+        s += v
+    if i >= window:
+        v_old = np.float64(x[i - window])
+        if np.isnan(v_old):
+            n_nan -= 1
+        else:
+            s -= v_old
+    return s, n_nan
+
+
+@njit(cache=True)
+def _welford_step(x, i, window, n_obs, mean, m2):
+    """Slide Welford's (count, mean, M2) state to the window ending at x[i]."""
+    v = np.float64(x[i])
+    if not np.isnan(v):
+        n_obs += 1
+        delta = v - mean
+        mean += delta / n_obs
+        m2 += delta * (v - mean)
+    if i >= window:
+        v_old = np.float64(x[i - window])
+        if not np.isnan(v_old):
+            n_obs -= 1
+            if n_obs > 0:
+                delta = v_old - mean
+                mean -= delta / n_obs
+                m2 -= delta * (v_old - mean)
+            else:
+                mean = 0.0
+                m2 = 0.0
+    return n_obs, mean, m2
+
+
+@njit(cache=True)
+def _same_run(x, i, run):
+    """Length of the run of identical values ending at x[i]."""
+    if i > 0 and x[i] == x[i - 1]:
+        return run + 1
+    return 1
+
+
+@njit(cache=True)
+def rolling_mean(x, window):
+    """Trailing rolling mean, equivalent to pd.Series(x).rolling(window).mean()."""
+    out = np.empty_like(x)
+    s = 0.0
+    n_nan = 0
+    run = 0
+    for i in range(len(x)):
+        s, n_nan = _sum_step(x, i, window, s, n_nan)
+        run = _same_run(x, i, run)
+        if i < window - 1 or n_nan > 0:
+            out[i] = np.nan
+        elif run >= window:
+            out[i] = x[i]
+        else:
+            out[i] = s / window
+    return out
+
+
+@njit(cache=True)
+def dual_rolling_mean(x, window_a, window_b):
+    """Two trailing rolling means computed in a single pass over x."""
+    out_a = np.empty_like(x)
+    out_b = np.empty_like(x)
+    s_a = 0.0
+    s_b = 0.0
+    n_nan_a = 0
+    n_nan_b = 0
+    run = 0
+    for i in range(len(x)):
+        s_a, n_nan_a = _sum_step(x, i, window_a, s_a, n_nan_a)
+        s_b, n_nan_b = _sum_step(x, i, window_b, s_b, n_nan_b)
+        run = _same_run(x, i, run)
+
+        if i < window_a - 1 or n_nan_a > 0:
+            out_a[i] = np.nan
+        elif run >= window_a:
+            out_a[i] = x[i]
+        else:
+            out_a[i] = s_a / window_a
+
+        if i < window_b - 1 or n_nan_b > 0:
+            out_b[i] = np.nan
+        elif run >= window_b:
+            out_b[i] = x[i]
+        else:
+            out_b[i] = s_b / window_b
+    return out_a, out_b
+
+
+@njit(cache=True)
+def rolling_mean_std(x, mean_window, std_window):
+    """
+    Trailing rolling mean and ddof=1 std in a single pass over x.
+
+    The std is maintained with Welford's add/remove update of (mean, M2).
+
+    Returns:
+        Tuple of (rolling mean over mean_window, rolling std over std_window)
+    """
+    out_mean = np.empty_like(x)
+    out_std = np.empty_like(x)
+    s = 0.0
+    n_nan = 0
+    n_obs = 0
+    w_mean = 0.0
+    m2 = 0.0
+    run = 0
+    for i in range(len(x)):
+        s, n_nan = _sum_step(x, i, mean_window, s, n_nan)
+        n_obs, w_mean, m2 = _welford_step(x, i, std_window, n_obs, w_mean, m2)
+        run = _same_run(x, i, run)
+
+        if i < mean_window - 1 or n_nan > 0:
+            out_mean[i] = np.nan
+        elif run >= mean_window:
+            out_mean[i] = x[i]
+        else:
+            out_mean[i] = s / mean_window
+
+        if n_obs < std_window or std_window < 2:
+            out_std[i] = np.nan
+        elif run >= std_window:
+            out_std[i] = 0.0
+        else:
+            out_std[i] = np.sqrt(max(m2, 0.0) / (std_window - 1))
+    return out_mean, out_std
+
+
+@njit(cache=True)
+def volatility_breakout(x, ma_window, vol_window, k):
+    """
+    Volatility breakout signal with mean, std and band test fused in one pass.
+
+    signal = (x - ma) / std - k above the upper band, (x - ma) / std + k
+    below the lower band, and 0 inside the bands or where ma/std are
+    undefined.
+    """
+    out = np.empty_like(x)
+    s = 0.0
+    n_nan = 0
+    n_obs = 0
+    w_mean = 0.0
+    m2 = 0.0
+    run = 0
+    for i in range(len(x)):
+        s, n_nan = _sum_step(x, i, ma_window, s, n_nan)
+        n_obs, w_mean, m2 = _welford_step(x, i, vol_window, n_obs, w_mean, m2)
+        run = _same_run(x, i, run)
+
+        out[i] = 0.0
+        if i < ma_window - 1 or n_nan > 0 or n_obs < vol_window or vol_window < 2:
+            continue
+        ma = x[i] if run >= ma_window else s / ma_window
+        std = 0.0 if run >= vol_window else np.sqrt(max(m2, 0.0) / (vol_window - 1))
+        if std > 0:
+            dev = (x[i] - ma) / std
+            out[i] = np.sign(dev) * max(abs(dev) - k, 0.0)
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Whole signal panel. One leaf kernel per registered signal writes its row of
+# the output; the dispatcher runs the rows in parallel threads. Only that
+# outer loop is a prange - the leaves are serial, as nested pranges would be
+# serialized anyway.
+# ---------------------------------------------------------------------------
+
+@njit(cache=True, error_model='numpy')
+def _momentum_row(monthly, month_pos, lookback, skip, out):
+    """12-1 momentum from a calendar-month grid, expanded via month_pos."""
+    for i in range(len(out)):
+        m = month_pos[i]
+        if m - lookback - skip >= 0:
+            out[i] = monthly[m - skip] / monthly[m - lookback - skip] - 1
+        else:
+            out[i] = np.nan
+
+
+@njit(cache=True, error_model='numpy')
+def _mean_reversion_row(x, short_window, long_window, out):
+    """-(x - MA(short)) / MA(long)."""
+    ma_short, ma_long = dual_rolling_mean(x, short_window, long_window)
+    for i in range(len(x)):
+        out[i] = -(x[i] - ma_short[i]) / ma_long[i]
+
+
+@njit(cache=True)
+def _volatility_breakout_row(x, ma_window, vol_window, k, out):
+    """Volatility breakout excess beyond the +/-k bands."""
+    out[:] = volatility_breakout(x, ma_window, vol_window, k)
+
+
+@njit(cache=True, error_model='numpy')
+def _ma_crossover_row(x, short_window, long_window, out):
+    """(MA(short) - MA(long)) / MA(long)."""
+    ma_short, ma_long = dual_rolling_mean(x, short_window, long_window)
+    for i in range(len(x)):
+        out[i] = (ma_short[i] - ma_long[i]) / ma_long[i]
+
+
+@njit(cache=True, error_model='numpy')
+def _value_row(x, lookback, out):
+    """-x / x lagged by lookback."""
+    for i in range(len(x)):
+        if i >= lookback:
+            out[i] = -(x[i] / x[i - lookback])
+        else:
+            out[i] = np.nan
+
+
+@njit(parallel=True, cache=True)
+def signal_panel(x, monthly, month_pos, mom_lookback, mom_skip,
+                 mr_short, mr_long, vb_ma, vb_vol, vb_k,
+                 mac_short, mac_long, value_lookback, out):
+    """
+    All five registered signals of one price array, one thread per signal.
+
+    Args:
+        x: Price array
+        monthly: Last price of each calendar month (gap-free month grid)
+        month_pos: For each entry of x, position in monthly of the latest
+            month end at or before it (-1 before the first)
+        mom_lookback, mom_skip: Momentum12_1 parameters
+        mr_short, mr_long: ShortTermMeanReversion windows
+        vb_ma, vb_vol, vb_k: VolatilityBreakout parameters
+        mac_short, mac_long: MovingAverageCrossover windows
+        value_lookback: ValueFactor lookback
+        out: Output array of shape (5, len(x)), rows in registry order
+    """
+    for j in prange(5):
+        if j == 0:
+            _momentum_row(monthly, month_pos, mom_lookback, mom_skip, out[0])
+        elif j == 1:
+            _mean_reversion_row(x, mr_short, mr_long, out[1])
+        elif j == 2:
+            _volatility_breakout_row(x, vb_ma, vb_vol, vb_k, out[2])
+        elif j == 3:
+            _ma_crossover_row(x, mac_short, mac_long, out[3])
+        else:
+            _value_row(x, value_lookback, out[4])
@@ -7,28 +7,289 @@ No fancy ML - that's the point.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Tuple, Optional
+from functools import lru_cache
+from typing import Dict, List, Tuple, Optional
+
+from kernels import (
+    NUMBA_AVAILABLE, dual_rolling_mean, rolling_mean, rolling_mean_std, signal_panel,
+    volatility_breakout
+)
+
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+try:
+    import bottleneck as bn
+except ImportError:
+    bn = None
+
+
+def _flat_windows(values: np.ndarray, window: int) -> np.ndarray:
+    """Mask of positions whose trailing window holds a single repeated value."""
+    n_same = np.concatenate(([0], np.cumsum(values[1:] == values[:-1])))
+    flat = np.zeros(len(values), dtype=bool)
+    if window <= len(values):
+        flat[window - 1:] = n_same[window - 1:] - n_same[:len(values) - window + 1] == window - 1
+    return flat
+
+
+def _use_bottleneck(values: np.ndarray, window: int) -> bool:
+    """
+    Whether bottleneck can take this rolling statistic.
+    
+    Its move_* functions reject windows longer than the array, and they
+    accumulate float32 input in float32, which drifts over long series.
+    """
+    return bn is not None and values.dtype == np.float64 and 1 <= window <= len(values)
+
+
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing rolling mean of a price array.
+    
+    Uses the compiled kernel when numba is available, then bottleneck, then
+    pandas. The bottleneck result is pinned to the value itself on flat
+    windows, where pandas is exact.
+    """
+    if NUMBA_AVAILABLE:
+        return rolling_mean(values, window)
+    if _use_bottleneck(values, window):
+        ma = bn.move_mean(values, window, min_count=window)
+        flat = _flat_windows(values, window)
+        ma[flat] = values[flat]
+        return ma
+    return pd.Series(values).rolling(window=window).mean().to_numpy(dtype=values.dtype)
+
+
+def _dual_rolling_mean(values: np.ndarray, window_a: int, window_b: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Two trailing rolling means of a price array, in one pass when numba is available."""
+    if NUMBA_AVAILABLE:
+        return dual_rolling_mean(values, window_a, window_b)
+    return _rolling_mean(values, window_a), _rolling_mean(values, window_b)
+
+
+def _rolling_mean_std(values: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Trailing rolling mean and std of a price array (numba kernel, else bottleneck, else pandas)."""
+    if NUMBA_AVAILABLE:
+        return rolling_mean_std(values, window, window)
+    if _use_bottleneck(values, window) and window >= 2:
+        ma = bn.move_mean(values, window, min_count=window)
+        std = bn.move_std(values, window, min_count=window, ddof=1)
+        flat = _flat_windows(values, window)
+        ma[flat] = values[flat]
+        std[flat] = 0.0
+        return ma, std
+    rolling = pd.Series(values).rolling(window=window)
+    return rolling.mean().to_numpy(dtype=values.dtype), rolling.std().to_numpy(dtype=values.dtype)
+
+
+def _shift(values: np.ndarray, periods: int) -> np.ndarray:
+    """values shifted forward by periods >= 0, NaN-filled (like Series.shift)."""
+    shifted = np.full(len(values), np.nan, dtype=values.dtype)
+    if periods < len(values):
+        shifted[periods:] = values[:len(values) - periods]
+    return shifted
+
+
+def _calendar_month_last(values: np.ndarray, index: pd.DatetimeIndex) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Last non-NaN value of each calendar month, like Series.resample('M').last().
+    
+    Months are handled as integer codes (months since 1970), so finding the
+    month ends and mapping dates back to them are plain integer ufuncs rather
+    than resample's groupby machinery or a search over timestamps.
+    
+    Returns:
+        Tuple of (monthly values for every month from the first to the last
+        observation - NaN where a month has no data, position in that grid
+        of the latest month end at or before each date - -1 before the first)
+    """
+    months = index.values.astype('datetime64[M]').view('i8')
+    
+    # Last valid observation in each month: the next valid one is in a later month
+    pos = np.nonzero(~np.isnan(values))[0]
+    valid_months = months[pos]
+    is_last = np.empty(len(pos), dtype=bool)
+    is_last[:-1] = valid_months[:-1] != valid_months[1:]
+    is_last[-1:] = True
+    month_end_pos = pos[is_last]
+    
+    # Scatter onto a gap-free calendar month grid so shifts count calendar months
+    first_month = months[0]
+    monthly = np.full(months[-1] - first_month + 1, np.nan, dtype=values.dtype)
+    monthly[months[month_end_pos] - first_month] = values[month_end_pos]
+    
+    # A month's end is labelled midnight of its last day: dates before that
+    # still map to the previous month
+    grid = np.arange(first_month + 1, first_month + len(monthly) + 1).view('datetime64[M]')
+    month_ends = (grid.astype('datetime64[D]') - 1).astype(index.values.dtype)
+    offset = months - first_month
+    month_pos = offset - (index.values < month_ends[offset])
+    
+    return monthly, month_pos
+
+
+def _monthly_grid(values: np.ndarray, index: Optional[pd.Index]) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Monthly price grid for the momentum signal.
+    
+    Returns:
+        Tuple of (monthly values, position in the monthly grid of the latest
+        month end at or before each input date - -1 before the first). For
+        input that is not daily (or has no index) the values are already
+        monthly and the positions are None.
+    """
+    freq = None if index is None else index.freq
+    is_daily = index is not None and (freq is None or freq.name.startswith('D'))
+    if not is_daily:
+        return values, None
+    
+    return _calendar_month_last(values, index)
+
+
+class SignalContext:
+    """
+    Rolling statistics of one price array, each computed at most once.
+    
+    Keyed by (op, window) with op in {'mean', 'std'}, so signals that share a
+    window (e.g. the 20-day mean) reuse the same array. Pass one context to
+    repeated compute / compute_array / compute_batch calls on the same prices
+    - e.g. a parameter sweep - to reuse statistics across calls; it holds
+    every statistic it has computed until it is discarded.
+    
+    Args:
+        prices: Price series or array the statistics are computed on
+        dtype: Floating dtype of the prices and statistics
+    """
+    
+    def __init__(self, prices, dtype=np.float64):
+        self.values = np.asarray(prices, dtype=dtype)
+        self._stats: Dict[Tuple[str, int], np.ndarray] = {}
+    
+    def has(self, *keys: Tuple[str, int]) -> bool:
+        """Whether all of the given (op, window) statistics are already computed."""
+        return all(key in self._stats for key in keys)
+    
+    def mean(self, window: int) -> np.ndarray:
+        """Rolling mean over window."""
+        key = ('mean', window)
+        if key not in self._stats:
+            self._stats[key] = _rolling_mean(self.values, window)
+        return self._stats[key]
+    
+    def std(self, window: int) -> np.ndarray:
+        """Rolling ddof=1 std over window."""
+        key = ('std', window)
+        if key not in self._stats:
+            # The same pass yields the mean over this window
+            ma, std = _rolling_mean_std(self.values, window)
+            self._stats[key] = std
+            self._stats.setdefault(('mean', window), ma)
+        return self._stats[key]
+    
+    def prefetch(self, keys: List[Tuple[str, int]]):
+        """Compute the requested statistics, pairing rolling means into shared passes."""
+        for op, window in keys:
+            if op == 'std':
+                self.std(window)
+        
+        pending = sorted({window for op, window in keys
+                          if op == 'mean' and ('mean', window) not in self._stats})
+        while len(pending) >= 2:
+            window_a, window_b = pending.pop(), pending.pop()
+            self._stats[('mean', window_a)], self._stats[('mean', window_b)] = \
+                _dual_rolling_mean(self.values, window_a, window_b)
+        for window in pending:
+            self.mean(window)
+
+
+def _resolve_context(values: np.ndarray, dtype, context: Optional[SignalContext]) -> SignalContext:
+    """The caller's context for these prices, or a fresh one."""
+    if context is None:
+        return SignalContext(values, dtype)
+    if len(context.values) != len(values):
+        raise ValueError(
+            f"SignalContext holds {len(context.values)} prices but {len(values)} were given"
+        )
+    return context
 
 
 class SignalDefinition:
     """Base class for signal definitions."""
     
-    def __init__(self, name: str, description: str):
-        self.name = name
-        self.description = description
+    # Display name and description, readable without instantiating
+    NAME = ""
+    DESCRIPTION = ""
+    
+    def __init__(self, name: Optional[str] = None, description: Optional[str] = None):
+        self.name = self.NAME if name is None else name
+        self.description = self.DESCRIPTION if description is None else description
     
-    def compute(self, prices: pd.Series, **params) -> pd.Series:
+    def compute(self, prices: pd.Series, dtype=np.float64,
+                context: Optional[SignalContext] = None, **params) -> pd.Series:
         """
         Compute signal values.
         
+        Args:
+            prices: Price series
+            dtype: Floating dtype the signal is computed and returned in
+            context: Optional SignalContext built on these prices, reused
+                across calls; its dtype takes precedence over dtype
+            **params: Signal parameters (defaults as in default_params)
+        
         Returns:
             pd.Series: Signal values (long/short signals, typically normalized)
         """
-        raise NotImplementedError
+        # The signal array is freshly allocated, so the Series can take it without a copy
+        signal = self.compute_array(prices.to_numpy(dtype=dtype), prices.index, dtype, context, **params)
+        return pd.Series(signal, index=prices.index, copy=False)
+    
+    def compute_f32(self, prices: pd.Series, **params) -> pd.Series:
+        """
+        Compute signal values in float32.
+        
+        Halves the memory held by the prices, rolling statistics and
+        signal; running sums are still accumulated in float64, and the
+        precision is ample for ranks and signs.
+        """
+        return self.compute(prices, np.float32, **params)
+    
+    def compute_array(self, values: np.ndarray, index: Optional[pd.Index] = None,
+                      dtype=np.float64, context: Optional[SignalContext] = None,
+                      **params) -> np.ndarray:
+        """
+        Compute signal values on a bare price array, without building a Series.
+        
+        Args:
+            values: Price array
+            index: DatetimeIndex of the prices; only calendar-based signals
+                (momentum) read it, and without it their input is taken to be
+                sampled at the signal's own frequency already
+            dtype: Floating dtype the signal is computed and returned in
+            context: Optional SignalContext built on these prices, reused
+                across calls; its dtype takes precedence over dtype
+            **params: Signal parameters (defaults as in default_params)
+        
+        Returns:
+            np.ndarray: Signal values aligned with values
+        """
+        context = _resolve_context(values, dtype, context)
+        return self._compute_values(context.values, index, context, params)
     
     def default_params(self) -> Dict:
         """Return default parameters for the signal."""
         raise NotImplementedError
+    
+    def _rolling_inputs(self, params: Dict) -> List[Tuple[str, int]]:
+        """Rolling statistics (op, window) read from the context, for batch prefetching."""
+        return []
+    
+    def _compute_values(self, values: np.ndarray, index: Optional[pd.Index],
+                        context: SignalContext, params: Dict) -> np.ndarray:
+        """Signal values as an array aligned with values."""
+        raise NotImplementedError
 
 
 class Momentum12_1(SignalDefinition):
@@ -39,11 +300,8 @@ class Momentum12_1(SignalDefinition):
     Returns = (Price(t-1) / Price(t-13)) - 1
     """
     
-    def __init__(self):
-        super().__init__(
-            name="12-1 Momentum",
-            description="12-month return lagged 1 month (Jegadeesh-Titman style)"
-        )
+    NAME = "12-1 Momentum"
+    DESCRIPTION = "12-month return lagged 1 month (Jegadeesh-Titman style)"
     
     def default_params(self) -> Dict:
         return {
@@ -51,25 +309,25 @@ class Momentum12_1(SignalDefinition):
             'skip_months': 1
         }
     
-    def compute(self, prices: pd.Series, **params) -> pd.Series:
-        lookback = params.get('lookback_months', 12)
+    def _compute_values(self, values: np.ndarray, index: Optional[pd.Index],
+                        context: SignalContext, params: Dict) -> np.ndarray:
         skip = params.get('skip_months', 1)
+        lookback_periods = params.get('lookback_months', 12) + skip
+        if len(values) == 0:
+            return values.copy()
         
-        # Convert to monthly if needed (assuming daily prices)
-        if prices.index.freq is None or prices.index.freq.name.startswith('D'):
-            monthly_prices = prices.resample('M').last()
-        else:
-            monthly_prices = prices
+        # Convert to monthly if needed (assuming daily prices); without an index
+        # the values are taken to be monthly already
+        monthly_values, month_pos = _monthly_grid(values, index)
         
         # Compute momentum: return from (t-lookback-skip) to (t-skip)
-        lookback_periods = lookback + skip
-        momentum = (monthly_prices.shift(skip) / monthly_prices.shift(lookback_periods)) - 1
-        
-        # Expand back to original frequency
-        if prices.index.freq is None or prices.index.freq.name.startswith('D'):
-            momentum = momentum.reindex(prices.index, method='ffill')
+        momentum = _shift(monthly_values, skip) / _shift(monthly_values, lookback_periods) - 1
+        if month_pos is None:
+            # Already monthly: nothing to expand
+            return momentum
         
-        return momentum
+        # Expand back to original frequency: each date takes the latest month end at or before it
+        return np.where(month_pos >= 0, momentum[np.maximum(month_pos, 0)], np.nan)
 
 
 class ShortTermMeanReversion(SignalDefinition):
@@ -80,11 +338,8 @@ class ShortTermMeanReversion(SignalDefinition):
     Signal = (Price - MA(short)) / MA(long)
     """
     
-    def __init__(self):
-        super().__init__(
-            name="Short-Term Mean Reversion",
-            description="Deviation from short-term moving average"
-        )
+    NAME = "Short-Term Mean Reversion"
+    DESCRIPTION = "Deviation from short-term moving average"
     
     def default_params(self) -> Dict:
         return {
@@ -92,17 +347,20 @@ class ShortTermMeanReversion(SignalDefinition):
             'long_window': 20   # days
         }
     
-    def compute(self, prices: pd.Series, **params) -> pd.Series:
+    def _rolling_inputs(self, params: Dict) -> List[Tuple[str, int]]:
+        return [('mean', params.get('short_window', 5)), ('mean', params.get('long_window', 20))]
+    
+    def _compute_values(self, values: np.ndarray, index: Optional[pd.Index],
+                        context: SignalContext, params: Dict) -> np.ndarray:
         short_window = params.get('short_window', 5)
         long_window = params.get('long_window', 20)
         
-        ma_short = prices.rolling(window=short_window).mean()
-        ma_long = prices.rolling(window=long_window).mean()
+        context.prefetch(self._rolling_inputs(params))
+        ma_short = context.mean(short_window)
+        ma_long = context.mean(long_window)
         
         # Negative signal: price below short MA relative to long MA = buy signal
-        signal = -(prices - ma_short) / ma_long
-        
-        return signal
+        return -(values - ma_short) / ma_long
 
 
 class VolatilityBreakout(SignalDefinition):
@@ -113,11 +371,8 @@ class VolatilityBreakout(SignalDefinition):
     Band = MA ± k * rolling_std
     """
     
-    def __init__(self):
-        super().__init__(
-            name="Volatility Breakout",
-            description="Price breakout beyond volatility-adjusted bands"
-        )
+    NAME = "Volatility Breakout"
+    DESCRIPTION = "Price breakout beyond volatility-adjusted bands"
     
     def default_params(self) -> Dict:
         return {
@@ -126,22 +381,46 @@ class VolatilityBreakout(SignalDefinition):
             'std_multiplier': 2.0
         }
     
-    def compute(self, prices: pd.Series, **params) -> pd.Series:
+    def _rolling_inputs(self, params: Dict) -> List[Tuple[str, int]]:
+        return [('mean', params.get('ma_window', 20)), ('std', params.get('volatility_window', 20))]
+    
+    def _compute_values(self, values: np.ndarray, index: Optional[pd.Index],
+                        context: SignalContext, params: Dict) -> np.ndarray:
         ma_window = params.get('ma_window', 20)
         vol_window = params.get('volatility_window', 20)
         k = params.get('std_multiplier', 2.0)
         
-        ma = prices.rolling(window=ma_window).mean()
-        rolling_std = prices.rolling(window=vol_window).std()
+        if NUMBA_AVAILABLE and not context.has(*self._rolling_inputs(params)):
+            # Mean, std and band test fused into one pass over the prices
+            return volatility_breakout(values, ma_window, vol_window, k)
+        
+        ma = context.mean(ma_window)
+        rolling_std = context.std(vol_window)
+        out = np.empty_like(values)
+        
+        if ne is not None:
+            # Whole band test as one blocked numexpr pass; NaN comparisons are false -> 0
+            # (integer 0 and a k of the price dtype keep float32 input in float32)
+            return ne.evaluate(
+                'where((p - m) / s > k, (p - m) / s - k, where((p - m) / s < -k, (p - m) / s + k, 0))',
+                local_dict={'p': values, 'm': ma, 's': rolling_std, 'k': values.dtype.type(k)},
+                out=out
+            )
         
-        upper_band = ma + k * rolling_std
-        lower_band = ma - k * rolling_std
+        # Standardized deviation from the MA; the bands sit at +/-k
+        np.subtract(values, ma, out=out)
+        np.divide(out, rolling_std, out=out)
         
-        # Signal: positive when above upper band, negative when below lower
-        signal = np.where(prices > upper_band, (prices - upper_band) / rolling_std,
-                 np.where(prices < lower_band, (prices - lower_band) / rolling_std, 0))
+        # Signal: excess beyond the upper band (positive) or lower band (negative), 0 inside.
+        # Undefined bands (warm-up, NaN prices) give 0, as a failed band comparison would.
+        excess = np.abs(out)
+        np.subtract(excess, k, out=excess)
+        np.maximum(excess, 0.0, out=excess)
+        np.sign(out, out=out)
+        np.multiply(out, excess, out=out)
+        out[np.isnan(out)] = 0.0
         
-        return pd.Series(signal, index=prices.index)
+        return out
 
 
 class MovingAverageCrossover(SignalDefinition):
@@ -151,11 +430,8 @@ class MovingAverageCrossover(SignalDefinition):
     Golden/Death cross: when short MA crosses above/below long MA.
     """
     
-    def __init__(self):
-        super().__init__(
-            name="MA Crossover",
-            description="Short-term MA crossing long-term MA"
-        )
+    NAME = "MA Crossover"
+    DESCRIPTION = "Short-term MA crossing long-term MA"
     
     def default_params(self) -> Dict:
         return {
@@ -163,17 +439,21 @@ class MovingAverageCrossover(SignalDefinition):
             'long_window': 200   # days
         }
     
-    def compute(self, prices: pd.Series, **params) -> pd.Series:
+    def _rolling_inputs(self, params: Dict) -> List[Tuple[str, int]]:
+        return [('mean', params.get('short_window', 50)), ('mean', params.get('long_window', 200))]
+    
+    def _compute_values(self, values: np.ndarray, index: Optional[pd.Index],
+                        context: SignalContext, params: Dict) -> np.ndarray:
         short_window = params.get('short_window', 50)
         long_window = params.get('long_window', 200)
         
-        ma_short = prices.rolling(window=short_window).mean()
-        ma_long = prices.rolling(window=long_window).mean()
+        # Both means from one pass over the prices
+        context.prefetch(self._rolling_inputs(params))
+        ma_short = context.mean(short_window)
+        ma_long = context.mean(long_window)
         
         # Signal: difference between MAs (positive when short > long)
-        signal = (ma_short - ma_long) / ma_long
-        
-        return signal
+        return (ma_short - ma_long) / ma_long
 
 
 class ValueFactor(SignalDefinition):
@@ -184,18 +464,16 @@ class ValueFactor(SignalDefinition):
     For price-only analysis, we use price-to-book proxies or earnings yield.
     """
     
-    def __init__(self):
-        super().__init__(
-            name="Value Factor",
-            description="Book-to-market ratio (requires fundamental data)"
-        )
+    NAME = "Value Factor"
+    DESCRIPTION = "Book-to-market ratio (requires fundamental data)"
     
     def default_params(self) -> Dict:
         return {
             'earnings_window': 252  # Use trailing earnings as proxy
         }
     
-    def compute(self, prices: pd.Series, **params) -> pd.Series:
+    def _compute_values(self, values: np.ndarray, index: Optional[pd.Index],
+                        context: SignalContext, params: Dict) -> np.ndarray:
         """
         Simplified value signal using price-to-earnings proxy.
         In real implementation, would use actual book value data.
@@ -205,32 +483,110 @@ class ValueFactor(SignalDefinition):
         # (falling prices = potentially undervalued)
         
         lookback = params.get('earnings_window', 252)
-        price_ratio = prices / prices.shift(lookback)
+        price_ratio = values / _shift(values, lookback)
         
         # Value signal: lower price ratio = higher value signal
-        signal = -price_ratio
-        
-        return signal
+        return -price_ratio
 
 
-# Signal registry
-SIGNAL_REGISTRY = {
-    'momentum_12_1': Momentum12_1(),
-    'mean_reversion': ShortTermMeanReversion(),
-    'volatility_breakout': VolatilityBreakout(),
-    'ma_crossover': MovingAverageCrossover(),
-    'value': ValueFactor()
+# Signal registry (classes; instances are built on first use by get_signal)
+_SIGNAL_FACTORIES = {
+    'momentum_12_1': Momentum12_1,
+    'mean_reversion': ShortTermMeanReversion,
+    'volatility_breakout': VolatilityBreakout,
+    'ma_crossover': MovingAverageCrossover,
+    'value': ValueFactor
 }
 
 
+@lru_cache(maxsize=None)
 def get_signal(name: str) -> SignalDefinition:
     """Get signal definition by name."""
-    if name not in SIGNAL_REGISTRY:
-        raise ValueError(f"Unknown signal: {name}. Available: {list(SIGNAL_REGISTRY.keys())}")
-    return SIGNAL_REGISTRY[name]
+    if name not in _SIGNAL_FACTORIES:
+        raise ValueError(f"Unknown signal: {name}. Available: {list(_SIGNAL_FACTORIES.keys())}")
+    return _SIGNAL_FACTORIES[name]()
 
 
 def list_signals() -> Dict[str, str]:
     """List all available signals with descriptions."""
-    return {name: sig.description for name, sig in SIGNAL_REGISTRY.items()}
+    return {name: cls.DESCRIPTION for name, cls in _SIGNAL_FACTORIES.items()}
+
 
+def compute_batch(prices: pd.Series, names: Optional[List[str]] = None,
+                  params: Optional[Dict[str, Dict]] = None, dtype=np.float64,
+                  context: Optional[SignalContext] = None) -> pd.DataFrame:
+    """
+    Compute several signals on one price series, sharing rolling statistics.
+    
+    The rolling means/stds needed by all requested signals are computed up
+    front, once per distinct (op, window) - e.g. the 20-day mean used by both
+    mean reversion and volatility breakout with default parameters.
+    
+    Args:
+        prices: Price series
+        names: Signal names (default: all registered signals)
+        params: Optional parameter overrides keyed by signal name
+        dtype: Floating dtype the signals are computed and returned in
+        context: Optional SignalContext built on these prices, reused across
+            calls; its dtype takes precedence over dtype
+    
+    Returns:
+        DataFrame with one column per signal, indexed like prices
+    """
+    names = list(_SIGNAL_FACTORIES.keys()) if names is None else list(names)
+    params = params or {}
+    signals = [get_signal(name) for name in names]
+    
+    context = _resolve_context(prices.to_numpy(dtype=dtype), dtype, context)
+    context.prefetch([key for name, signal in zip(names, signals)
+                      for key in signal._rolling_inputs(params.get(name, {}))])
+    
+    values = context.values
+    out = np.empty((len(values), len(names)), dtype=values.dtype)
+    for j, (name, signal) in enumerate(zip(names, signals)):
+        out[:, j] = signal._compute_values(values, prices.index, context, params.get(name, {}))
+    
+    return pd.DataFrame(out, index=prices.index, columns=names)
+
+
+def compute_all(prices: pd.Series, params: Optional[Dict[str, Dict]] = None,
+                dtype=np.float64) -> pd.DataFrame:
+    """
+    Compute every registered signal on one price series, in parallel.
+    
+    With numba the five signals run as compiled kernels on separate threads;
+    otherwise this is compute_batch over all signals.
+    
+    Args:
+        prices: Price series
+        params: Optional parameter overrides keyed by signal name
+        dtype: Floating dtype the signals are computed and returned in
+    
+    Returns:
+        DataFrame with one column per registered signal, indexed like prices
+    """
+    values = prices.to_numpy(dtype=dtype)
+    if not NUMBA_AVAILABLE or len(values) == 0:
+        return compute_batch(prices, params=params, dtype=dtype)
+    
+    params = params or {}
+    names = list(_SIGNAL_FACTORIES.keys())
+    p = {name: {**get_signal(name).default_params(), **params.get(name, {})} for name in names}
+    
+    # Month-end bookkeeping stays in NumPy; the kernel only gathers from the grid
+    monthly, month_pos = _monthly_grid(values, prices.index)
+    if month_pos is None:
+        month_pos = np.arange(len(values))
+    
+    out = np.empty((len(names), len(values)), dtype=values.dtype)
+    signal_panel(
+        values, np.ascontiguousarray(monthly), month_pos,
+        int(p['momentum_12_1']['lookback_months']), int(p['momentum_12_1']['skip_months']),
+        int(p['mean_reversion']['short_window']), int(p['mean_reversion']['long_window']),
+        int(p['volatility_breakout']['ma_window']), int(p['volatility_breakout']['volatility_window']),
+        float(p['volatility_breakout']['std_multiplier']),
+        int(p['ma_crossover']['short_window']), int(p['ma_crossover']['long_window']),
+        int(p['value']['earnings_window']), out
+    )
+    
+    return pd.DataFrame(out.T, index=prices.index, columns=names)